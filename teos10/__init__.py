@@ -28,6 +28,8 @@ All functions have the following inputs:
         Total pressure in dbar.
     salinity
         Absolute salinity in g / kg.
+Each input can be a scalar or an array, and arrays are broadcast against each other,
+so that a whole set of conditions can be evaluated in a single call.
 
 By default, properties are calculated for seawater.  This can be changed by providing
 a different Gibbs energy function to the optional ``gfunc`` kwarg.
@@ -40,6 +42,10 @@ gibbs.salt
     Gibbs energy of the salt component in J / kg.
 gibbs.seawater
     Gibbs energy of seawater (water + salt) in J / kg.
+gibbs.seawater_jit
+    As gibbs.seawater, but compiled with JAX (fastest for repeated evaluation).
+gibbs_core.water, gibbs_core.salt, gibbs_core.seawater
+    As the gibbs functions, but evaluated with NumPy alone (not differentiable).
 adiabatic_lapse_rate
     Isentropic temperature-pressure coefficient, adiabatic lapse rate in K / Pa.
 chemical_potential_relative
@@ -81,6 +87,7 @@ validity
 from . import (
     constants,
     gibbs,
+    gibbs_core,
     properties,
 )
 from .gibbs import validity
@@ -107,6 +114,7 @@ from .properties import (
 __all__ = [
     "constants",
     "gibbs",
+    "gibbs_core",
     "properties",
     "adiabatic_lapse_rate",
     "chemical_potential_relative",
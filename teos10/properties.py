@@ -2,6 +2,8 @@
 # Copyright (C) 2020-2024  Matthew Paul Humphreys  (GNU GPLv3)
 """Water properties based on derivatives of Gibbs energy functions."""
 
+from functools import cache
+
 import jax
 from jax import numpy as np
 
@@ -10,42 +12,118 @@ from . import constants, gibbs
 default = gibbs.seawater  # which Gibbs energy function to use by default
 
 
+def _elementwise(func):
+    """Compile the scalar function `func` so that it can be called on arrays.
+
+    The arguments are broadcast against each other and `func` is mapped over every
+    element with `jax.vmap`, so that a single call evaluates the whole array.
+    """
+
+    def elementwise(*args):
+        args = np.broadcast_arrays(*args)
+        shape = args[0].shape
+        return jax.tree.map(
+            lambda value: value.reshape(shape),
+            jax.vmap(func)(*(arg.ravel() for arg in args)),
+        )
+
+    return jax.jit(elementwise)
+
+
+# The derivative functions are cached on `gfunc` so that each one is only built and
+# compiled once, rather than being re-traced every time a property is calculated.
+@cache
 def dG_dT(gfunc):
     """Function for the first derivative of `gfunc` w.r.t. temperature."""
-    return jax.grad(gfunc)
+    return _elementwise(jax.grad(gfunc))
 
 
+@cache
 def dG_dp(gfunc):
     """Function for the first derivative of `gfunc` w.r.t. pressure."""
-    return lambda *args: jax.grad(gfunc, argnums=1)(*args) / constants.dbar_to_Pa
+    return _elementwise(
+        lambda *args: jax.grad(gfunc, argnums=1)(*args) / constants.dbar_to_Pa
+    )
 
 
+@cache
 def dG_dS(gfunc):
     """Function for the first derivative of `gfunc` w.r.t. salinity."""
-    return lambda *args: jax.grad(gfunc, argnums=2)(*args) / constants.salinity_to_salt
+    return _elementwise(
+        lambda *args: jax.grad(gfunc, argnums=2)(*args) / constants.salinity_to_salt
+    )
 
 
+@cache
 def d2G_dT2(gfunc):
     """Function for the second derivative of `gfunc` w.r.t. temperature."""
-    return jax.grad(dG_dT(gfunc), argnums=0)
+    return _elementwise(jax.grad(jax.grad(gfunc)))
 
 
+@cache
 def d2G_dSdp(gfunc):
     """Function for the derivative of `gfunc` w.r.t. salinity and pressure."""
-    return (
-        lambda *args: jax.grad(dG_dp(gfunc), argnums=2)(*args)
-        / constants.salinity_to_salt
+    return _elementwise(
+        lambda *args: (
+            jax.grad(jax.grad(gfunc, argnums=1), argnums=2)(*args)
+            / (constants.dbar_to_Pa * constants.salinity_to_salt)
+        )
     )
 
 
+@cache
 def d2G_dTdp(gfunc):
     """Function for the derivative of `gfunc` w.r.t. temperature and pressure."""
-    return lambda *args: jax.grad(dG_dT(gfunc), argnums=1)(*args) / constants.dbar_to_Pa
+    return _elementwise(
+        lambda *args: jax.grad(jax.grad(gfunc), argnums=1)(*args) / constants.dbar_to_Pa
+    )
 
 
+@cache
 def d2G_dp2(gfunc):
     """Function for the second derivative of `gfunc` w.r.t. pressure."""
-    return lambda *args: jax.grad(dG_dp(gfunc), argnums=1)(*args) / constants.dbar_to_Pa
+    return _elementwise(
+        lambda *args: (
+            jax.grad(jax.grad(gfunc, argnums=1), argnums=1)(*args)
+            / constants.dbar_to_Pa**2
+        )
+    )
+
+
+@cache
+def _G_and_grads(gfunc):
+    """Function for `gfunc` and its first derivatives w.r.t. temperature and pressure,
+    all from a single evaluation."""
+
+    def G_and_grads(*args):
+        G, (G_T, G_p) = jax.value_and_grad(gfunc, argnums=(0, 1))(*args)
+        return G, G_T, G_p / constants.dbar_to_Pa
+
+    return _elementwise(G_and_grads)
+
+
+@cache
+def _grads_and_hessian(gfunc):
+    """Function for the first and second derivatives of `gfunc` w.r.t. temperature and
+    pressure, all from a single evaluation."""
+
+    def grads(*args):
+        grads = jax.grad(gfunc, argnums=(0, 1))(*args)
+        return grads, grads
+
+    def grads_and_hessian(*args):
+        ((G_TT, G_Tp), (_, G_pp)), (G_T, G_p) = jax.jacfwd(
+            grads, argnums=(0, 1), has_aux=True
+        )(*args)
+        return (
+            G_T,
+            G_p / constants.dbar_to_Pa,
+            G_TT,
+            G_Tp / constants.dbar_to_Pa,
+            G_pp / constants.dbar_to_Pa**2,
+        )
+
+    return _elementwise(grads_and_hessian)
 
 
 def density(*args, gfunc=default):
@@ -65,19 +143,22 @@ def heat_capacity(*args, gfunc=default):
 
 def enthalpy(*args, gfunc=default):
     """Specific enthalpy (h) in J/kg.  IAPWS09 Table 3 (7)."""
-    return gfunc(*args) + args[0] * entropy(*args, gfunc=gfunc)
+    G, G_T, _ = _G_and_grads(gfunc)(*args)
+    return G - args[0] * G_T
 
 
 def internal_energy(*args, gfunc=default):
     """Specific internal energy (u) in J/kg.  IAPWS09 Table 3 (8)."""
     pressure_Pa = args[1] * constants.dbar_to_Pa
-    return enthalpy(*args, gfunc=gfunc) - pressure_Pa * dG_dp(gfunc)(*args)
+    G, G_T, G_p = _G_and_grads(gfunc)(*args)
+    return G - args[0] * G_T - pressure_Pa * G_p
 
 
 def helmholtz_energy(*args, gfunc=default):
     """Specific Helmholtz energy (f) in J/kg.  IAPWS09 Table 3 (9)."""
     pressure_Pa = args[1] * constants.dbar_to_Pa
-    return gfunc(*args) - pressure_Pa * dG_dp(gfunc)(*args)
+    G, _, G_p = _G_and_grads(gfunc)(*args)
+    return G - pressure_Pa * G_p
 
 
 def thermal_expansion(*args, gfunc=default):
@@ -98,17 +179,14 @@ def isothermal_compressibility(*args, gfunc=default):
 
 def isenotropic_compressibility(*args, gfunc=default):
     """Isentropic compressibility (kappa_s) in 1/Pa.  IAPWS09 Table 3 (13)."""
-    return (
-        d2G_dTdp(gfunc)(*args) ** 2 - d2G_dT2(gfunc)(*args) * d2G_dp2(gfunc)(*args)
-    ) / (dG_dp(gfunc)(*args) * dG_dT(gfunc)(*args))
+    _, G_p, G_TT, G_Tp, G_pp = _grads_and_hessian(gfunc)(*args)
+    return (G_Tp**2 - G_TT * G_pp) / (G_p * G_TT)
 
 
 def sound_speed(*args, gfunc=default):
     """Speed of sound (w) in m/s.  IAPWS09 Table 3 (14)."""
-    return dG_dp(gfunc)(*args) * np.sqrt(
-        d2G_dT2(gfunc)(*args)
-        / (d2G_dTdp(gfunc)(*args) ** 2 - d2G_dT2(gfunc)(*args) * d2G_dp2(gfunc)(*args))
-    )
+    _, G_p, G_TT, G_Tp, G_pp = _grads_and_hessian(gfunc)(*args)
+    return G_p * np.sqrt(G_TT / (G_Tp**2 - G_TT * G_pp))
 
 
 def chemical_potential_relative(*args, gfunc=default):
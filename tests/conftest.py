@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import teos10
+
+
+def _readonly(values):
+    """Convert `values` to a C-contiguous float64 array that cannot be modified in
+    place."""
+    values = np.array(values, dtype=np.float64, order="C")
+    values.flags.writeable = False
+    return values
+
+
+@pytest.fixture(scope="session")
+def inputs_salt():
+    """Temperature (T), pressure (p) and salinity (S) for the check values in IAPWS08
+    Tables 8-10.  These are rows of a single (3, N) block, xTpS, so they can also be
+    passed as `*inputs_salt.xTpS`.
+    """
+    xTpS = _readonly(
+        [
+            [273.15, 353, 273.15],
+            np.array([101_325, 101_325, 1e8]) / teos10.constants.dbar_to_Pa,
+            np.array([0.035_165_04, 0.1, 0.035_165_04])
+            / teos10.constants.salinity_to_salt,
+        ]
+    )
+    return SimpleNamespace(xTpS=xTpS, T=xTpS[0], p=xTpS[1], S=xTpS[2])
+
+
+@pytest.fixture(scope="session")
+def inputs_salt_large(inputs_salt):
+    """The inputs_salt block tiled to 3 million columns, for benchmark tests."""
+    xTpS = _readonly(np.tile(inputs_salt.xTpS, (1, 1_000_000)))
+    return SimpleNamespace(xTpS=xTpS, T=xTpS[0], p=xTpS[1], S=xTpS[2])
+
+
+@pytest.fixture(scope="session")
+def inputs_water():
+    """Temperature (T) and pressure (p) for the check values in IAPWS09 Table 6.  These
+    are rows of a single (2, N) block, xTp, so they can also be passed as
+    `*inputs_water.xTp`.
+    """
+    xTp = _readonly(
+        [
+            [273.15, 273.15, 313.15],
+            np.array([101_325, 1e8, 101_325]) / teos10.constants.dbar_to_Pa,
+        ]
+    )
+    return SimpleNamespace(xTp=xTp, T=xTp[0], p=xTp[1])
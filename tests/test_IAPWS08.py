@@ -1,13 +1,11 @@
+from functools import partial
+
 import numpy as np
+import pytest
 
 import teos10
 
-# Check values from IAPWS08 Tables 8-10
-temperatures = np.array([273.15, 353, 273.15])
-pressures = np.array([101_325, 101_325, 1e8]) / teos10.constants.dbar_to_Pa
-salinitys = (
-    np.array([0.035_165_04, 0.1, 0.035_165_04]) / teos10.constants.salinity_to_salt
-)
+# Check values from IAPWS08 Tables 8-10; inputs are in the inputs_salt fixture
 # Note that we can only properly test the middle value of each entry in check_tables,
 # i.e., the salt contribution, because the pure water (and therefore total) values are
 # based on an earlier version of the pure water equation, and so are not expected to
@@ -91,205 +89,141 @@ check_tables[10] = {
         0.953_214_082e5,
     ],  # J kg-1
 }
+# Convert the check values to arrays once, here, rather than in every test
+check_tables = {
+    table: {key: np.array(values, dtype=np.float64) for key, values in checks.items()}
+    for table, checks in check_tables.items()
+}
 
+# Stack Tables 8-10 so that each row of checks[key] matches one row of inputs_salt
+checks = {
+    key: np.stack([check_tables[table][key] for table in [8, 9, 10]])
+    for key in check_tables[8]
+}
 
-def formatter(value):
-    return "{:.8e}".format(value)
-
-
-def test_gibbs():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.gibbs.water(t, p))
-        tvt.append(teos10.gibbs.salt(t, p, s))
-        tvt.append(teos10.gibbs.seawater(t, p, s))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["gibbs"][1]) == formatter(tvt[1])
-
-
-def test_dG_dS():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(0.0)
-        tvt.append(teos10.properties.dG_dS(teos10.gibbs.salt)(t, p, s))
-        tvt.append(teos10.properties.dG_dS(teos10.gibbs.seawater)(t, p, s))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["dG_dS"][1]) == formatter(tvt[1])
-
-
-def test_dG_dT():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.properties.dG_dT(teos10.gibbs.water)(t, p))
-        tvt.append(teos10.properties.dG_dT(teos10.gibbs.salt)(t, p, s))
-        tvt.append(teos10.properties.dG_dT(teos10.gibbs.seawater)(t, p, s))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["dG_dT"][1]) == formatter(tvt[1])
-
-
-def test_dG_dp():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.properties.dG_dp(teos10.gibbs.water)(t, p))
-        tvt.append(teos10.properties.dG_dp(teos10.gibbs.salt)(t, p, s))
-        tvt.append(teos10.properties.dG_dp(teos10.gibbs.seawater)(t, p, s))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["dG_dp"][1]) == formatter(tvt[1])
-
-
-def test_d2G_dSdp():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(0.0)
-        tvt.append(teos10.properties.d2G_dSdp(teos10.gibbs.salt)(t, p, s))
-        tvt.append(teos10.properties.d2G_dSdp(teos10.gibbs.seawater)(t, p, s))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["d2G_dSdp"][1]) == formatter(tvt[1])
-
-
-def test_d2G_dT2():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.properties.d2G_dT2(teos10.gibbs.water)(t, p))
-        tvt.append(teos10.properties.d2G_dT2(teos10.gibbs.salt)(t, p, s))
-        tvt.append(teos10.properties.d2G_dT2(teos10.gibbs.seawater)(t, p, s))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["d2G_dT2"][1]) == formatter(tvt[1])
-
-
-def test_d2G_dTdp():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.properties.d2G_dTdp(teos10.gibbs.water)(t, p))
-        tvt.append(teos10.properties.d2G_dTdp(teos10.gibbs.salt)(t, p, s))
-        tvt.append(teos10.properties.d2G_dTdp(teos10.gibbs.seawater)(t, p, s))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["d2G_dTdp"][1]) == formatter(tvt[1])
-
-
-def test_d2G_dp2():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.properties.d2G_dp2(teos10.gibbs.water)(t, p))
-        tvt.append(teos10.properties.d2G_dp2(teos10.gibbs.salt)(t, p, s))
-        tvt.append(teos10.properties.d2G_dp2(teos10.gibbs.seawater)(t, p, s))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["d2G_dp2"][1]) == formatter(tvt[1])
-
-
-def test_enthalpy():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.enthalpy(t, p, gfunc=teos10.gibbs.water))
-        tvt.append(teos10.enthalpy(t, p, s, gfunc=teos10.gibbs.salt))
-        tvt.append(teos10.enthalpy(t, p, s, gfunc=teos10.gibbs.seawater))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["enthalpy"][1]) == formatter(tvt[1])
+# Functions returning the salt part of each property, which is the only part that should
+# match the check values exactly.  The salt parts of density and sound speed are not
+# defined (NaN in the tables), so those are not included.
+salt_funcs = {
+    "gibbs": teos10.gibbs.salt,
+    "dG_dS": teos10.properties.dG_dS(teos10.gibbs.salt),
+    "dG_dT": teos10.properties.dG_dT(teos10.gibbs.salt),
+    "dG_dp": teos10.properties.dG_dp(teos10.gibbs.salt),
+    "d2G_dSdp": teos10.properties.d2G_dSdp(teos10.gibbs.salt),
+    "d2G_dT2": teos10.properties.d2G_dT2(teos10.gibbs.salt),
+    "d2G_dTdp": teos10.properties.d2G_dTdp(teos10.gibbs.salt),
+    "d2G_dp2": teos10.properties.d2G_dp2(teos10.gibbs.salt),
+    "enthalpy": partial(teos10.enthalpy, gfunc=teos10.gibbs.salt),
+    "helmholtz_energy": partial(teos10.helmholtz_energy, gfunc=teos10.gibbs.salt),
+    "internal_energy": partial(teos10.internal_energy, gfunc=teos10.gibbs.salt),
+    "entropy": partial(teos10.entropy, gfunc=teos10.gibbs.salt),
+    "heat_capacity": partial(teos10.heat_capacity, gfunc=teos10.gibbs.salt),
+    "chemical_potential_water": partial(
+        teos10.chemical_potential_water, gfunc=teos10.gibbs.salt
+    ),
+}
 
 
-def test_helmholtz_energy():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.helmholtz_energy(t, p, gfunc=teos10.gibbs.water))
-        tvt.append(teos10.helmholtz_energy(t, p, s, gfunc=teos10.gibbs.salt))
-        tvt.append(teos10.helmholtz_energy(t, p, s, gfunc=teos10.gibbs.seawater))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["helmholtz_energy"][1]) == formatter(
-            tvt[1]
+@pytest.mark.parametrize("prop", list(salt_funcs))
+def test_salt(prop, inputs_salt):
+    """Compare the salt part of each property with check values from IAPWS08."""
+    test_values = salt_funcs[prop](*inputs_salt.xTpS)
+    np.testing.assert_allclose(
+        np.asarray(test_values, dtype=float),
+        checks[prop][:, 1],
+        rtol=1e-8,
+        atol=0,
+        equal_nan=True,
+    )
+
+
+# Functions for the derivatives of the Gibbs energy, which are linear in it, each taking
+# the Gibbs energy function as its argument (the Gibbs energy itself is checked in
+# test_gibbs.py)
+linear_funcs = {
+    "dG_dS": teos10.properties.dG_dS,
+    "dG_dT": teos10.properties.dG_dT,
+    "dG_dp": teos10.properties.dG_dp,
+    "d2G_dSdp": teos10.properties.d2G_dSdp,
+    "d2G_dT2": teos10.properties.d2G_dT2,
+    "d2G_dTdp": teos10.properties.d2G_dTdp,
+    "d2G_dp2": teos10.properties.d2G_dp2,
+}
+# Derivatives w.r.t. salinity, which have no pure water part
+salinity_derivatives = {"dG_dS", "d2G_dSdp"}
+
+
+@pytest.mark.parametrize("prop", list(linear_funcs))
+def test_seawater(prop, inputs_salt):
+    """Check that each derivative of the seawater Gibbs energy is the sum of its water
+    and salt parts."""
+    seawater = linear_funcs[prop](teos10.gibbs.seawater)(*inputs_salt.xTpS)
+    salt = linear_funcs[prop](teos10.gibbs.salt)(*inputs_salt.xTpS)
+    if prop in salinity_derivatives:
+        np.testing.assert_allclose(
+            np.asarray(seawater), np.asarray(salt), rtol=1e-12, atol=0
+        )
+    else:
+        # Compare seawater minus salt with water, as in test_gibbs.test_seawater_gibbs
+        water = linear_funcs[prop](teos10.gibbs.water)(inputs_salt.T, inputs_salt.p)
+        np.testing.assert_allclose(
+            np.asarray(seawater - salt), np.asarray(water), rtol=1e-12, atol=0
         )
 
 
-def test_internal_energy():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.internal_energy(t, p, gfunc=teos10.gibbs.water))
-        tvt.append(teos10.internal_energy(t, p, s, gfunc=teos10.gibbs.salt))
-        tvt.append(teos10.internal_energy(t, p, s, gfunc=teos10.gibbs.seawater))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["internal_energy"][1]) == formatter(tvt[1])
-
-
-def test_entropy():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.entropy(t, p, gfunc=teos10.gibbs.water))
-        tvt.append(teos10.entropy(t, p, s, gfunc=teos10.gibbs.salt))
-        tvt.append(teos10.entropy(t, p, s, gfunc=teos10.gibbs.seawater))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["entropy"][1]) == formatter(tvt[1])
-
-
-def test_density():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.density(t, p, gfunc=teos10.gibbs.water))
-        tvt.append(np.nan)
-        tvt.append(teos10.density(t, p, s, gfunc=teos10.gibbs.seawater))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["density"][1]) == formatter(tvt[1])
-
-
-def test_heat_capacity():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.heat_capacity(t, p, gfunc=teos10.gibbs.water))
-        tvt.append(teos10.heat_capacity(t, p, s, gfunc=teos10.gibbs.salt))
-        tvt.append(teos10.heat_capacity(t, p, s, gfunc=teos10.gibbs.seawater))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["heat_capacity"][1]) == formatter(tvt[1])
-
-
-def test_sound_speed():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.sound_speed(t, p, gfunc=teos10.gibbs.water))
-        tvt.append(np.nan)
-        tvt.append(teos10.sound_speed(t, p, s, gfunc=teos10.gibbs.seawater))
-        # Only the salt part should be identical
-        assert formatter(check_tables[table]["sound_speed"][1]) == formatter(tvt[1])
-
-
-def test_chemical_potential_water():
-    """Compare Gibbs energy with check values from IAPWS08."""
-    test_values = {}
-    for table, t, p, s in zip([8, 9, 10], temperatures, pressures, salinitys):
-        test_values[table] = tvt = []
-        tvt.append(teos10.chemical_potential_water(t, p, gfunc=teos10.gibbs.water))
-        tvt.append(teos10.chemical_potential_water(t, p, s, gfunc=teos10.gibbs.salt))
-        tvt.append(
-            teos10.chemical_potential_water(t, p, s, gfunc=teos10.gibbs.seawater)
-        )
-        # Only the salt part should be identical
-        assert formatter(
-            check_tables[table]["chemical_potential_water"][1]
-        ) == formatter(tvt[1])
+def test_seawater_default(inputs_salt):
+    """Check density, sound speed and isentropic compressibility with the default gfunc
+    (seawater) against their definitions in terms of the derivatives of the seawater
+    Gibbs energy.
+    """
+    g_p = teos10.properties.dG_dp(teos10.gibbs.seawater)(*inputs_salt.xTpS)
+    g_TT = teos10.properties.d2G_dT2(teos10.gibbs.seawater)(*inputs_salt.xTpS)
+    g_Tp = teos10.properties.d2G_dTdp(teos10.gibbs.seawater)(*inputs_salt.xTpS)
+    g_pp = teos10.properties.d2G_dp2(teos10.gibbs.seawater)(*inputs_salt.xTpS)
+    np.testing.assert_allclose(
+        np.asarray(teos10.density(*inputs_salt.xTpS)),
+        np.asarray(1 / g_p),
+        rtol=1e-12,
+        atol=0,
+    )
+    np.testing.assert_allclose(
+        np.asarray(teos10.sound_speed(*inputs_salt.xTpS)),
+        np.asarray(g_p * np.sqrt(g_TT / (g_Tp**2 - g_TT * g_pp))),
+        rtol=1e-12,
+        atol=0,
+    )
+    np.testing.assert_allclose(
+        np.asarray(teos10.isenotropic_compressibility(*inputs_salt.xTpS)),
+        np.asarray((g_Tp**2 - g_TT * g_pp) / (g_p * g_TT)),
+        rtol=1e-12,
+        atol=0,
+    )
+    # Isentropic compressibility is also 1 / (density * sound_speed**2)
+    np.testing.assert_allclose(
+        np.asarray(teos10.isenotropic_compressibility(*inputs_salt.xTpS)),
+        np.asarray(
+            1
+            / (
+                teos10.density(*inputs_salt.xTpS)
+                * teos10.sound_speed(*inputs_salt.xTpS) ** 2
+            )
+        ),
+        rtol=1e-12,
+        atol=0,
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("prop", ["gibbs", "dG_dT", "heat_capacity"])
+def test_salt_large(prop, inputs_salt_large):
+    """Evaluate the salt part of a property on millions of inputs and compare with the
+    tiled check values from IAPWS08.
+    """
+    test_values = salt_funcs[prop](*inputs_salt_large.xTpS)
+    np.testing.assert_allclose(
+        np.asarray(test_values, dtype=float),
+        np.tile(checks[prop][:, 1], 1_000_000),
+        rtol=1e-8,
+        atol=0,
+        equal_nan=True,
+    )
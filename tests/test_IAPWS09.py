@@ -1,10 +1,11 @@
+from functools import partial
+
 import numpy as np
+import pytest
 
 import teos10
 
-# Check values from IAPWS09 Table 6
-temperature_water = np.array([273.15, 273.15, 313.15])
-pressure_water = np.array([101_325, 1e8, 101_325]) / teos10.constants.dbar_to_Pa
+# Check values from IAPWS09 Table 6; inputs are in the inputs_water fixture
 check_water = {
     "gibbs": [0.101_342_743e3, 0.977_303_868e5, -0.116_198_898e5],  # J kg-1
     "dG_dT": [0.147_644_587, 0.851_506_346e1, -0.572_365_181e3],  # J kg-1 K-1
@@ -24,131 +25,36 @@ check_water = {
     "heat_capacity": [0.421_941_153e4, 0.390_523_030e4, 0.417_942_416e4],  # J kg-1 K-1
     "sound_speed": [0.140_240_099e4, 0.157_543_089e4, 0.152_891_242e4],  # m s-1
 }
+check_water = {
+    key: np.array(values, dtype=np.float64) for key, values in check_water.items()
+}
 
-
-def factor_sigfig(x):
-    return 10.0 ** np.ceil(np.log10(np.abs(x)))
-
-
-def sigfig(x, sf):
-    """Return `x` to `sf` significant figures."""
-    factor = 10.0 ** np.ceil(np.log10(np.abs(x)))
-    return factor * np.round(x / factor, decimals=sf)
-
-
-def formatter(values):
-    return ("{:.8e} " * len(values)).format(*sigfig(values, 9))
-
-
-def test_gibbs_water():
-    """Compare pure water Gibbs energy with check values from IAPWS09."""
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.gibbs.water(t, p))
-    assert formatter(check_water["gibbs"]) == formatter(test_values)
-
-
-def test_dG_dT_water():
-    """Compare temperature derivative of pure water Gibbs energy with check values from
-    IAPWS09.
-    """
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.properties.dG_dT(teos10.gibbs.water)(t, p))
-    assert formatter(check_water["dG_dT"]) == formatter(test_values)
-
-
-def test_dG_dp_water():
-    """Compare pressure derivative of pure water Gibbs energy with check values from
-    IAPWS09.
-    """
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.properties.dG_dp(teos10.gibbs.water)(t, p))
-    assert formatter(check_water["dG_dp"]) == formatter(test_values)
-
-
-def test_d2G_dT2_water():
-    """Compare second temperature derivative of pure water Gibbs energy with check
-    values from IAPWS09.
-    """
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.properties.d2G_dT2(teos10.gibbs.water)(t, p))
-    assert formatter(check_water["d2G_dT2"]) == formatter(test_values)
-
-
-def test_d2G_dTdp_water():
-    """Compare temperature-pressure derivative of pure water Gibbs energy with check
-    values from IAPWS09.
-    """
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.properties.d2G_dTdp(teos10.gibbs.water)(t, p))
-    assert formatter(check_water["d2G_dTdp"]) == formatter(test_values)
-
-
-def test_d2G_dp2_water():
-    """Compare temperature-pressure derivative of pure water Gibbs energy with check
-    values from IAPWS09.
-    """
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.properties.d2G_dp2(teos10.gibbs.water)(t, p))
-    assert formatter(check_water["d2G_dp2"]) == formatter(test_values)
-
-
-def test_enthalpy_water():
-    """Compare pure water enthalpy with check values from IAPWS09."""
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.enthalpy(t, p, gfunc=teos10.gibbs.water))
-    assert formatter(check_water["enthalpy"]) == formatter(test_values)
-
-
-def test_helmholtz_energy_water():
-    """Compare pure water Helmholtz energy with check values from IAPWS09."""
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.helmholtz_energy(t, p, gfunc=teos10.gibbs.water))
-    assert formatter(check_water["helmholtz_energy"]) == formatter(test_values)
-
-
-def test_internal_energy_water():
-    """Compare pure water internal energy with check values from IAPWS09."""
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.internal_energy(t, p, gfunc=teos10.gibbs.water))
-    assert formatter(check_water["internal_energy"]) == formatter(test_values)
-
-
-def test_entropy_water():
-    """Compare pure water entropy with check values from IAPWS09."""
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.entropy(t, p, gfunc=teos10.gibbs.water))
-    assert formatter(check_water["entropy"]) == formatter(test_values)
-
-
-def test_density_water():
-    """Compare pure water density with check values from IAPWS09."""
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.density(t, p, gfunc=teos10.gibbs.water))
-    assert formatter(check_water["density"]) == formatter(test_values)
-
-
-def test_heat_capacity_water():
-    """Compare pure water heat capacity with check values from IAPWS09."""
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.heat_capacity(t, p, gfunc=teos10.gibbs.water))
-    assert formatter(check_water["heat_capacity"]) == formatter(test_values)
+# Functions returning each property of pure water
+water_funcs = {
+    "gibbs": teos10.gibbs.water,
+    "dG_dT": teos10.properties.dG_dT(teos10.gibbs.water),
+    "dG_dp": teos10.properties.dG_dp(teos10.gibbs.water),
+    "d2G_dT2": teos10.properties.d2G_dT2(teos10.gibbs.water),
+    "d2G_dTdp": teos10.properties.d2G_dTdp(teos10.gibbs.water),
+    "d2G_dp2": teos10.properties.d2G_dp2(teos10.gibbs.water),
+    "enthalpy": partial(teos10.enthalpy, gfunc=teos10.gibbs.water),
+    "helmholtz_energy": partial(teos10.helmholtz_energy, gfunc=teos10.gibbs.water),
+    "internal_energy": partial(teos10.internal_energy, gfunc=teos10.gibbs.water),
+    "entropy": partial(teos10.entropy, gfunc=teos10.gibbs.water),
+    "density": partial(teos10.density, gfunc=teos10.gibbs.water),
+    "heat_capacity": partial(teos10.heat_capacity, gfunc=teos10.gibbs.water),
+    "sound_speed": partial(teos10.sound_speed, gfunc=teos10.gibbs.water),
+}
 
 
-def test_sound_speed_water():
-    """Compare pure water sound speed with check values from IAPWS09."""
-    test_values = []
-    for t, p in zip(temperature_water, pressure_water):
-        test_values.append(teos10.sound_speed(t, p, gfunc=teos10.gibbs.water))
-    assert formatter(check_water["sound_speed"]) == formatter(test_values)
+@pytest.mark.parametrize("prop", list(water_funcs))
+def test_water(prop, inputs_water):
+    """Compare each pure water property with check values from IAPWS09."""
+    test_values = water_funcs[prop](*inputs_water.xTp)
+    np.testing.assert_allclose(
+        np.asarray(test_values, dtype=float),
+        check_water[prop],
+        rtol=1e-8,
+        atol=0,
+        equal_nan=True,
+    )
@@ -0,0 +1,150 @@
+import jax
+import numpy as np
+import pytest
+from jax import numpy as jnp
+
+import teos10
+
+
+def gibbs_args(gname, inputs_salt):
+    """Arguments from `inputs_salt` for the Gibbs function called `gname`, dropping
+    salinity for pure water."""
+    return inputs_salt.xTpS[:2] if gname == "water" else inputs_salt.xTpS
+
+
+@pytest.mark.parametrize("asarray", [np.asarray, jnp.asarray], ids=["numpy", "jax"])
+def test_seawater_gibbs(asarray, inputs_salt):
+    """Check that seawater Gibbs energy is the sum of its water and salt parts.
+
+    The seawater values themselves can pass near zero, so compare seawater minus salt
+    against water instead.
+    """
+    T, p, S = (asarray(values) for values in inputs_salt.xTpS)
+    np.testing.assert_allclose(
+        np.asarray(teos10.gibbs.seawater(T, p, S) - teos10.gibbs.salt(T, p, S)),
+        np.asarray(teos10.gibbs.water(T, p)),
+        rtol=1e-12,
+        atol=0,
+    )
+
+
+@pytest.mark.parametrize("gname", ["water", "salt", "seawater"])
+def test_gibbs_np(gname, inputs_salt):
+    """Compare the NumPy evaluation of each Gibbs function in gibbs_core with its JAX
+    evaluation through gibbs, with the same inputs as jax.numpy arrays.
+    """
+    args = gibbs_args(gname, inputs_salt)
+    # atol allows for seawater Gibbs energy being almost zero at the reference state
+    np.testing.assert_allclose(
+        getattr(teos10.gibbs_core, gname)(*args),
+        np.asarray(getattr(teos10.gibbs, gname)(*(jnp.asarray(arg) for arg in args))),
+        rtol=1e-12,
+        atol=1e-9,
+    )
+
+
+def test_gibbs_lists(inputs_salt):
+    """Check that the Gibbs functions accept lists as well as arrays."""
+    T, p, S = (values.tolist() for values in inputs_salt.xTpS)
+    np.testing.assert_array_equal(
+        teos10.gibbs.water(T, p), teos10.gibbs.water(inputs_salt.T, inputs_salt.p)
+    )
+    np.testing.assert_array_equal(
+        teos10.gibbs.salt(T, p, S), teos10.gibbs.salt(*inputs_salt.xTpS)
+    )
+    np.testing.assert_array_equal(
+        teos10.gibbs.seawater(T, p, S), teos10.gibbs.seawater(*inputs_salt.xTpS)
+    )
+
+
+@pytest.mark.parametrize("asarray", [np.asarray, jnp.asarray], ids=["numpy", "jax"])
+@pytest.mark.parametrize("gname", ["water", "salt", "seawater"])
+def test_gibbs_f32(gname, asarray, inputs_salt):
+    """Check that float32 Gibbs energy is within a few hundredths of a J/kg of the
+    float64 value, with both NumPy and JAX inputs."""
+    gfunc = getattr(teos10.gibbs, gname)
+    args = [asarray(arg) for arg in gibbs_args(gname, inputs_salt)]
+    test_values = gfunc(*args, precision="f32")
+    assert test_values.dtype == np.float32
+    np.testing.assert_allclose(
+        np.asarray(test_values, dtype=float),
+        np.asarray(gfunc(*args), dtype=float),
+        rtol=0,
+        atol=0.05,
+    )
+
+
+@pytest.mark.parametrize("gname", ["water", "salt", "seawater"])
+def test_gibbs_f32_grad(gname, inputs_salt):
+    """Check that the temperature and pressure derivatives of float32 Gibbs energy,
+    through the cast to float32, are close to the float64 derivatives."""
+    gfunc = getattr(teos10.gibbs, gname)
+    args = gibbs_args(gname, inputs_salt)
+
+    def grads(precision):
+        return jax.grad(
+            lambda *values: gfunc(*values, precision=precision).sum(), argnums=(0, 1)
+        )(*(jnp.asarray(arg) for arg in args))
+
+    for test_values, expected in zip(grads("f32"), grads("f64")):
+        np.testing.assert_allclose(
+            np.asarray(test_values), np.asarray(expected), rtol=1e-5, atol=1e-4
+        )
+
+
+@pytest.mark.parametrize("asarray", [np.asarray, jnp.asarray], ids=["numpy", "jax"])
+def test_gibbs_precision_invalid(asarray, inputs_salt):
+    """Check that an unknown precision raises a ValueError."""
+    with pytest.raises(ValueError, match="precision"):
+        teos10.gibbs.seawater(
+            *(asarray(arg) for arg in inputs_salt.xTpS), precision="f16"
+        )
+
+
+@pytest.mark.parametrize("precision, atol", [("f64", 1e-9), ("f32", 0.05)])
+def test_seawater_jit(precision, atol, inputs_salt):
+    """Check that seawater_jit, both called directly and compiled ahead of time as
+    described in gibbs, matches gibbs.seawater."""
+    expected = teos10.gibbs.seawater(*inputs_salt.xTpS, precision=precision)
+    f64 = jax.ShapeDtypeStruct(inputs_salt.T.shape, jnp.float64)
+    seawater_aot = teos10.gibbs.seawater_jit.lower(
+        f64, f64, f64, precision=precision
+    ).compile()
+    for test_values in [
+        teos10.gibbs.seawater_jit(*inputs_salt.xTpS, precision=precision),
+        seawater_aot(*inputs_salt.xTpS),
+    ]:
+        assert test_values.dtype == expected.dtype
+        np.testing.assert_allclose(
+            np.asarray(test_values, dtype=float),
+            np.asarray(expected, dtype=float),
+            rtol=1e-12,
+            atol=atol,
+        )
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("gname", ["salt", "seawater"])
+def test_gibbs_zero_salinity(gname):
+    """Check that zero salinity gives NaN without warnings, with NumPy as with JAX."""
+    gfunc = getattr(teos10.gibbs, gname)
+    args = (np.array([283.15]), np.array([100.0]), np.array([0.0]))
+    assert np.isnan(gfunc(*args)).all()
+    assert np.isnan(gfunc(*(jnp.asarray(arg) for arg in args))).all()
+
+
+def test_validity():
+    """Check the validity ranges at and just beyond each of their limits."""
+    # Pressure limits of 100 Pa (0.01 dbar) and 1e8 Pa (1e4 dbar)
+    pressure = np.array([0.01, 0.0099, 1e4, 1e4 + 1e-6])
+    validity = teos10.gibbs.validity(np.full(4, 283.15), pressure)
+    np.testing.assert_array_equal(validity.pressure, [True, False, True, False])
+    np.testing.assert_array_equal(validity.temperature, True)
+    np.testing.assert_array_equal(validity.total, validity.pressure)
+    # Temperature limits of 313.15 K (inclusive) and, at 1e8 Pa, 270.5 - 7.43 K
+    # (exclusive)
+    temperature = np.array([313.15, 313.15 + 1e-9, 263.07 + 1e-9, 263.07 - 1e-9])
+    validity = teos10.gibbs.validity(temperature, np.full(4, 1e4))
+    np.testing.assert_array_equal(validity.temperature, [True, False, True, False])
+    np.testing.assert_array_equal(validity.pressure, True)
+    np.testing.assert_array_equal(validity.total, validity.temperature)
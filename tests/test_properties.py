@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+import teos10
+
+
+@pytest.mark.parametrize(
+    "prop", [teos10.density, teos10.heat_capacity, teos10.sound_speed]
+)
+def test_broadcast(prop):
+    """Check that inputs of different shapes are broadcast against each other and give
+    the same results as evaluating each combination of scalar inputs separately."""
+    T = np.array([[278.15], [293.15]])
+    p = np.array([10.0, 1000.0, 5000.0])
+    S = 35.0
+    test_values = prop(T, p, S)
+    assert test_values.shape == (2, 3)
+    expected = [[prop(T_i, p_j, S) for p_j in p] for T_i in T[:, 0]]
+    np.testing.assert_allclose(
+        np.asarray(test_values), np.asarray(expected), rtol=1e-12, atol=0
+    )